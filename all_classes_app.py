@@ -23,13 +23,16 @@ time blocks.
 
 from __future__ import annotations
 
+import bisect
+import functools
 import json
 import os
+import sys
 import threading
 import time
-from datetime import datetime, date, timedelta
+from datetime import datetime, date, timedelta, time as dttime
 from pathlib import Path
-from typing import Dict, Optional, Tuple, Any
+from typing import Dict, List, Optional, Tuple, Any
 
 # Import shared schedule utilities from the single‑period application.  These
 # functions expose the rotation (letter days), period ordering and time slot
@@ -43,20 +46,95 @@ except ImportError:
     tk = None  # type: ignore
     messagebox = None  # type: ignore
 
+# Optional C-accelerated JSON codec for the configuration file; the
+# stdlib module remains the fallback.
 try:
-    import win32com.client  # type: ignore
-    import pythoncom  # type: ignore
+    import orjson  # type: ignore
 except ImportError:
-    win32com = None  # type: ignore
-    pythoncom = None  # type: ignore
+    orjson = None  # type: ignore
+
+# The pywin32 COM modules are imported lazily: Outlook automation only
+# happens after the user confirms a reminder, which may be hours after
+# startup or never, so paying the import cost at module load is wasted.
+_com_modules: Optional[Tuple[Any, Any, Any]] = None
+_com_unavailable = False
 
-# Import tray icon dependencies if available
-try:
-    from PIL import Image
-    import pystray
-except ImportError:
-    Image = None  # type: ignore
-    pystray = None  # type: ignore
+
+def _import_outlook() -> Optional[Tuple[Any, Any, Any]]:
+    """Import the COM modules on first use.
+
+    Returns ``(win32com.client, pythoncom, pywintypes)``, or ``None``
+    when pywin32 is not installed.  The result is cached module-wide so
+    subsequent calls skip the import machinery entirely.
+    """
+    global _com_modules, _com_unavailable
+    if _com_modules is None and not _com_unavailable:
+        try:
+            import win32com.client  # type: ignore
+            import pythoncom  # type: ignore
+            import pywintypes  # type: ignore
+            _com_modules = (win32com.client, pythoncom, pywintypes)
+        except ImportError:
+            _com_unavailable = True
+    return _com_modules
+
+
+# Optional Windows Runtime toast support.  Toasts are rendered by the
+# OS notification service, so reminders need no per-prompt GUI work and
+# never steal focus; the Tk dialog remains the fallback.
+_toast_modules: Optional[Tuple[Any, Any]] = None
+_toast_unavailable = False
+
+
+def _import_toast() -> Optional[Tuple[Any, Any]]:
+    """Import the winsdk toast-notification modules on first use.
+
+    Returns ``(notifications, dom)`` from the Windows Runtime
+    projection, or ``None`` when ``winsdk`` is not installed.
+    """
+    global _toast_modules, _toast_unavailable
+    if _toast_modules is None and not _toast_unavailable:
+        try:
+            from winsdk.windows.ui import notifications  # type: ignore
+            from winsdk.windows.data.xml import dom  # type: ignore
+            _toast_modules = (notifications, dom)
+        except ImportError:
+            _toast_unavailable = True
+    return _toast_modules
+
+
+@functools.lru_cache(maxsize=8)
+def _day_schedule(
+    day_ordinal: int, lunch_option: str
+) -> Tuple[Tuple[int, ...], Tuple[Tuple[int, int, student_app.ClassTime], ...]]:
+    """Return the reminder schedule for a single school day.
+
+    The result is a pair ``(reminder_hhmms, entries)`` where ``entries``
+    holds ``(period_number, reminder_hhmm, class_time)`` tuples sorted
+    by reminder time and ``reminder_hhmms`` is the parallel sorted key
+    tuple, suitable for bisecting straight to the first pending slot.
+    Both are empty on weekends.  The reminder wall-clock time is packed
+    as ``hour * 100 + minute`` so the scheduler compares plain integers
+    instead of decomposing ``time`` objects.  The letter day, period
+    ordering and time slots are all constant for a given (date, lunch
+    option), so the computation is memoized and repeated lookups for
+    the same day cost a single dict hit.
+    """
+    d = date.fromordinal(day_ordinal)
+    if d.weekday() >= 5:
+        return (), ()
+    letter = student_app.get_letter_day(d)
+    order = student_app.PERIOD_ORDER.get(letter, [])
+    time_slots = student_app.get_time_slots(d.weekday() == 2, lunch_option)
+    entries = []
+    for idx, class_time in enumerate(time_slots):
+        if idx >= len(order):
+            break
+        reminder_time = class_time.reminder_time(5)
+        reminder_hhmm = reminder_time.hour * 100 + reminder_time.minute
+        entries.append((order[idx], reminder_hhmm, class_time))
+    entries.sort(key=lambda entry: entry[1])
+    return tuple(entry[1] for entry in entries), tuple(entries)
 
 
 class AllClassesApp:
@@ -71,11 +149,46 @@ class AllClassesApp:
         # Use provided lunch option or fall back to the global setting in student_app
         self.lunch_option = lunch_option or student_app.LUNCH_OPTION
         self.running = True
+        # Event used to interrupt the scheduled sleep in ``_run_loop`` so
+        # that shutdown takes effect immediately rather than after the
+        # current wait expires.
+        self._wake = threading.Event()
         self.thread: Optional[threading.Thread] = None
-        # Track last reminder per period to avoid multiple prompts within the
-        # same day.  Keys are (date, period_number) and values indicate
-        # whether the reminder has already fired today.
-        self.triggered: Dict[Tuple[date, int], bool] = {}
+        # Track which periods have already prompted today as a bitmask
+        # (bit n set means period n fired).  The date the mask refers to
+        # is kept alongside it and the mask is zeroed when the day rolls
+        # over, so no per-iteration pruning is needed.  The lock
+        # serialises access from the monitoring thread and the tray-icon
+        # thread; harmless under the GIL but required for free-threaded
+        # builds.
+        self._state_lock = threading.Lock()
+        self._triggered_day: date = date.min
+        self._triggered_mask: int = 0
+        # Outlook appointments confirmed from a toast.  WinRT delivers
+        # activation callbacks on arbitrary thread-pool threads, so the
+        # handler only queues ``(class_date, period_index)`` here and
+        # wakes the monitoring thread, which owns all COM state.
+        self._pending_events: List[Tuple[date, int]] = []
+        # Monotonic timestamp of the last fired reminder, used to
+        # debounce duplicate prompts without blocking the thread.
+        # ``None`` means nothing has fired yet; on Windows the
+        # monotonic clock starts near zero at boot, so a zero sentinel
+        # would swallow a reminder due right after auto-start at logon.
+        self._last_fire_ns: Optional[int] = None
+        # Cached Outlook Application object; dispatched lazily on first
+        # use and reused for subsequent appointments.  COM itself is
+        # initialised on the monitoring thread the first time an event
+        # is created.
+        self._outlook = None
+        self._com_initialized = False
+        # Hidden Tk root reused for every reminder dialog; constructing
+        # a fresh interpreter per prompt is slow and wasteful.  Tk
+        # objects may only be used from the thread that created them,
+        # and the main thread parks in join() without pumping events,
+        # so the root is created lazily on the monitoring thread by
+        # ``_ensure_tk_root`` and torn down when that thread exits.
+        self._tk_root = None
+        self._tk_unavailable = tk is None
 
     def start(self) -> None:
         """Start the background monitoring thread without blocking.
@@ -88,97 +201,269 @@ class AllClassesApp:
             self.thread = threading.Thread(target=self._run_loop, daemon=True)
             self.thread.start()
 
+    def stop(self) -> None:
+        """Request shutdown of the monitoring thread.
+
+        Clears the ``running`` flag and wakes the scheduler so that a
+        pending sleep is interrupted instead of running to completion.
+        """
+        with self._state_lock:
+            self.running = False
+            self._wake.set()
+
+    def _ensure_tk_root(self) -> Optional["tk.Tk"]:
+        """Return the hidden Tk root, creating it on first use.
+
+        Only ever called from the monitoring thread, so the root is
+        owned by the thread that actually shows the dialogs.  ``None``
+        means no GUI is available (tkinter missing or no display).
+        """
+        if self._tk_root is None and not self._tk_unavailable:
+            try:
+                self._tk_root = tk.Tk()
+                self._tk_root.withdraw()
+                self._tk_root.attributes('-topmost', True)
+            except Exception:
+                self._tk_root = None
+                self._tk_unavailable = True
+        return self._tk_root
+
+    def _compute_next_reminder(
+        self, now: datetime
+    ) -> Tuple[datetime, Optional[Tuple[int, student_app.ClassTime]]]:
+        """Find the next wake-up that should happen after ``now``.
+
+        Scans the remaining time slots of today (skipping periods whose
+        reminder already fired) and returns ``(wake_dt, payload)`` where
+        ``payload`` is ``(period_number, class_time)`` for a reminder.
+        When nothing is left today (including weekends) the wake is a
+        housekeeping one just after midnight with a ``None`` payload, so
+        stale trigger state never outlives the day it belongs to.
+        """
+        d = now.date()
+        now_hhmm = now.hour * 100 + now.minute
+        with self._state_lock:
+            triggered_day = self._triggered_day
+            triggered_mask = self._triggered_mask
+        reminder_hhmms, entries = _day_schedule(d.toordinal(), self.lunch_option)
+        # Jump straight past every slot whose reminder time has already
+        # passed; bisect_right keeps the "current minute counts as
+        # fired" semantics of the old linear scan.
+        start = bisect.bisect_right(reminder_hhmms, now_hhmm)
+        for period_number, reminder_hhmm, class_time in entries[start:]:
+            if d == triggered_day and triggered_mask & (1 << period_number):
+                continue
+            candidate = datetime(
+                d.year, d.month, d.day, reminder_hhmm // 100, reminder_hhmm % 100
+            )
+            return candidate, (period_number, class_time)
+        # No reminders remain today: wake shortly after midnight to
+        # reset per-day state and evaluate the new day's schedule.
+        return datetime.combine(d + timedelta(days=1), dttime(0, 0, 1)), None
+
     def _run_loop(self) -> None:
-        while self.running:
-            now = datetime.now()
-            # Reset triggers at midnight
-            self.triggered = {
-                (d, p): fired
-                for (d, p), fired in self.triggered.items()
-                if d == now.date()
-            }
-            if now.weekday() < 5:  # Monday–Friday
-                # Determine the letter day and period ordering
-                letter = student_app.get_letter_day(now.date())
-                order = student_app.PERIOD_ORDER.get(letter, [])
-                # Pass lunch option so that midday times reflect the student's schedule
-                time_slots = student_app.get_time_slots(now.weekday() == 2, self.lunch_option)
-                # Iterate through the five time slots and associated periods
-                for idx, class_time in enumerate(time_slots):
-                    if idx >= len(order):
-                        break
-                    period_number = order[idx]
-                    reminder_time = class_time.reminder_time(5)
-                    key = (now.date(), period_number)
-                    if (
-                        now.time().hour == reminder_time.hour
-                        and now.time().minute == reminder_time.minute
-                        and not self.triggered.get(key, False)
-                    ):
-                        self.triggered[key] = True
-                        self.show_reminder(now.date(), period_number, class_time)
-                        # Avoid immediate re‑prompt
-                        time.sleep(60)
-                        break
-            time.sleep(self.check_interval)
+        try:
+            while self.running:
+                # Create any appointments confirmed via a toast since
+                # the last pass; the activation handler queues them and
+                # wakes this thread so COM stays on it.
+                with self._state_lock:
+                    pending, self._pending_events = self._pending_events, []
+                for event_date, event_period in pending:
+                    self._create_event_for(event_date, event_period)
+                now = datetime.now()
+                # Reset triggers when the date rolls over
+                with self._state_lock:
+                    if now.date() != self._triggered_day:
+                        self._triggered_day = now.date()
+                        self._triggered_mask = 0
+                next_dt, payload = self._compute_next_reminder(now)
+                delta = (next_dt - datetime.now()).total_seconds()
+                # Sleep until the reminder is due; ``stop`` interrupts
+                # the wait.  Long waits (overnight, weekends) are capped
+                # at an hour so suspend/resume and wall-clock changes
+                # are picked up promptly - still only one wake per hour
+                # while idle.
+                capped = delta > 3600.0
+                if self._wake.wait(timeout=min(max(0.0, delta), 3600.0)):
+                    self._wake.clear()
+                    continue
+                if not self.running:
+                    break
+                if capped:
+                    # Not due yet; re-evaluate the schedule.
+                    continue
+                if payload is None:
+                    # Housekeeping wake: the rollover check at the top
+                    # of the loop clears yesterday's trigger state.
+                    continue
+                # Guard against wall-clock jumps: only fire once the
+                # reminder time has genuinely been reached.
+                if datetime.now() < next_dt:
+                    continue
+                period_number, class_time = payload
+                # Debounce: never prompt twice within a minute, e.g.
+                # after a wall-clock jump.  Consecutive reminders are
+                # always further apart than this on the real schedule.
+                now_ns = time.monotonic_ns()
+                if (
+                    self._last_fire_ns is not None
+                    and now_ns - self._last_fire_ns < 60_000_000_000
+                ):
+                    continue
+                self._last_fire_ns = now_ns
+                with self._state_lock:
+                    self._triggered_mask |= 1 << period_number
+                self.show_reminder(next_dt.date(), period_number, class_time)
+        finally:
+            # Destroy the Tk root on the thread that owns it.
+            if self._tk_root is not None:
+                try:
+                    self._tk_root.destroy()
+                except Exception:
+                    pass
+                self._tk_root = None
+            # Tear down COM if an Outlook event ever initialised it on
+            # this thread.
+            if self._com_initialized:
+                modules = _import_outlook()
+                if modules is not None:
+                    modules[1].CoUninitialize()
+                self._com_initialized = False
 
     def show_reminder(self, class_date: date, period_index: int, class_time: student_app.ClassTime) -> None:
         """
-        Display the reminder window for the given period.
+        Display the reminder for the given period.
 
-        If the user confirms they have homework, look up the next meeting
+        A native Windows toast is preferred because it is rendered
+        asynchronously by the OS and does not steal focus; when the
+        toast API is unavailable the hidden-root Tk dialog is used.  If
+        the user confirms they have homework, look up the next meeting
         of the same period (respecting the lunch option) and open an
         Outlook appointment window.
         """
-        if tk is None:
+        if self._show_toast_reminder(class_date, period_index):
+            return
+        root = self._ensure_tk_root()
+        if root is None:
             return
-        root = tk.Tk()
-        root.withdraw()
-        root.attributes('-topmost', True)
         result = messagebox.askyesno(
             title="Homework Reminder",
             message=f"Class period {period_index} is ending soon.  Do you have homework?",
             parent=root,
         )
-        root.destroy()
+        # Drain pending Tk events so the hidden root stays responsive
+        root.update()
         if result:
-            # Compute the next occurrence of this period using the rotation
-            next_info = student_app.get_next_class(period_index, class_date, self.lunch_option)
-            if next_info is not None:
-                next_date, next_time = next_info
-                start_dt = datetime.combine(next_date, next_time.start)
-                end_dt = datetime.combine(next_date, next_time.end)
-                self.create_outlook_event(period_index, start_dt, end_dt)
+            self._create_event_for(class_date, period_index)
+
+    def _show_toast_reminder(self, class_date: date, period_index: int) -> bool:
+        """Show the reminder as a Windows toast with Yes/No actions.
+
+        Returns ``True`` when the toast was handed to the notification
+        service (the Yes handler then queues the Outlook appointment
+        for the monitoring thread), ``False`` when toasts are
+        unavailable and the caller should fall back to the Tk dialog.
+        """
+        modules = _import_toast()
+        if modules is None:
+            return False
+        notifications, dom = modules
+        try:
+            xml = dom.XmlDocument()
+            xml.load_xml(
+                "<toast>"
+                "<visual><binding template='ToastGeneric'>"
+                f"<text>Class period {period_index} is ending soon.  "
+                "Do you have homework?</text>"
+                "</binding></visual>"
+                "<actions>"
+                "<action content='Yes' arguments='hw=1'/>"
+                "<action content='No' arguments='hw=0'/>"
+                "</actions>"
+                "</toast>"
+            )
+            toast = notifications.ToastNotification(xml)
+
+            def on_activated(sender: Any, args: Any) -> None:
+                # The handler receives an un-projected Object; it must
+                # be cast before the action arguments are readable.
+                try:
+                    activated = notifications.ToastActivatedEventArgs._from(args)
+                except Exception:
+                    return
+                if activated.arguments == 'hw=1':
+                    # Hand the work to the monitoring thread; creating
+                    # the appointment here would use COM from whichever
+                    # MTA thread-pool thread delivered the activation.
+                    with self._state_lock:
+                        self._pending_events.append((class_date, period_index))
+                    self._wake.set()
+
+            toast.add_activated(on_activated)
+            notifier = notifications.ToastNotificationManager.create_toast_notifier(
+                'Skaphysics Homework Reminder'
+            )
+            notifier.show(toast)
+            return True
+        except Exception:
+            return False
+
+    def _create_event_for(self, class_date: date, period_index: int) -> None:
+        """Create the Outlook appointment for the period's next meeting."""
+        # Compute the next occurrence of this period using the rotation
+        next_info = student_app.get_next_class(period_index, class_date, self.lunch_option)
+        if next_info is not None:
+            next_date, next_time = next_info
+            start_dt = datetime.combine(next_date, next_time.start)
+            end_dt = datetime.combine(next_date, next_time.end)
+            self.create_outlook_event(period_index, start_dt, end_dt)
 
     def create_outlook_event(self, period_index: int, start_dt: datetime, end_dt: datetime) -> None:
         """Create a calendar appointment in Outlook for the given period.
 
-        A COM initialisation is attempted on the current thread to
-        ensure that Outlook automation works reliably.  If pywin32 is
-        unavailable or an exception occurs, the error is ignored so that
-        the reminder application continues running.
+        The pywin32 modules are imported and COM is initialised for this
+        thread on first use; the Outlook Application object is then
+        dispatched once and cached on the instance.  If pywin32 is
+        unavailable or an exception occurs, the error is ignored so
+        that the reminder application continues running.
         """
-        if win32com is None or pythoncom is None:
+        modules = _import_outlook()
+        if modules is None:
             return
+        com_client, pythoncom, pywintypes = modules
         try:
-            pythoncom.CoInitialize()
-            outlook = win32com.Dispatch('Outlook.Application')
-            appt = outlook.CreateItem(1)
-            appt.Start = start_dt.strftime("%m/%d/%Y %H:%M")
-            appt.End = end_dt.strftime("%m/%d/%Y %H:%M")
+            if not self._com_initialized:
+                pythoncom.CoInitializeEx(pythoncom.COINIT_APARTMENTTHREADED)
+                self._com_initialized = True
+            if self._outlook is None:
+                # Early binding: generate (or load) the type-library
+                # wrapper so attribute access on appointments resolves
+                # by DISPID instead of a name lookup per property.
+                self._outlook = com_client.gencache.EnsureDispatch('Outlook.Application')
+            appt = self._outlook.CreateItem(com_client.constants.olAppointmentItem)
+            # Pass datetimes directly as VT_DATE values; formatting a
+            # string here would only make Outlook re-parse it (and is
+            # ambiguous under non-US regional settings).
+            appt.Start = pywintypes.Time(start_dt)
+            appt.End = pywintypes.Time(end_dt)
             appt.Subject = f"Homework – Period {period_index}"
             appt.Body = "Enter your assignment details here."
             appt.ReminderSet = True
             appt.ReminderMinutesBeforeStart = 60
             appt.Display(True)
         except Exception:
-            pass
+            # Drop the cached handle so a stale object (e.g. after an
+            # Outlook restart) is re-dispatched on the next reminder.
+            self._outlook = None
 
 
 def load_config(path: Path) -> Dict[str, Any]:
     """Read JSON configuration or return an empty dict."""
     if path.exists():
         try:
+            if orjson is not None:
+                return orjson.loads(path.read_bytes())
             with path.open('r', encoding='utf-8') as f:
                 return json.load(f)
         except Exception:
@@ -188,6 +473,9 @@ def load_config(path: Path) -> Dict[str, Any]:
 
 def save_config(path: Path, data: Dict[str, Any]) -> None:
     """Write configuration data to disk."""
+    if orjson is not None:
+        path.write_bytes(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+        return
     with path.open('w', encoding='utf-8') as f:
         json.dump(data, f, indent=2)
 
@@ -201,6 +489,19 @@ def main() -> None:
     passed to the scheduler so that midday times are calculated
     correctly.
     """
+    # Refuse to run a second copy side-by-side (auto-started plus
+    # user-launched), which would double every reminder and Outlook
+    # appointment.  The mutex handle must stay referenced for the
+    # lifetime of the process to keep the name claimed.
+    try:
+        import win32event  # type: ignore
+        import win32api  # type: ignore
+        import winerror  # type: ignore
+        mutex = win32event.CreateMutex(None, False, 'Skaphysics-Homework-Reminder')
+        if win32api.GetLastError() == winerror.ERROR_ALREADY_EXISTS:
+            return
+    except ImportError:
+        mutex = None
     config_dir = Path(os.environ.get('APPDATA', Path.home())) / 'SkaphysicsHomeworkReminder'
     config_dir.mkdir(parents=True, exist_ok=True)
     config_path = config_dir / 'student_config.json'
@@ -215,19 +516,52 @@ def main() -> None:
     student_app.set_lunch_option(lunch_option)
     # Copy the current script/executable into the Startup folder so
     # students do not need to manually copy it.  The name reflects
-    # the Skaphysics branding.
-    student_app.ensure_startup_copy('Skaphysics Homework Reminder')
+    # the Skaphysics branding.  A manifest of the source file's stat
+    # data is kept in the config so unchanged launches skip the copy
+    # helper (and its file I/O) after a couple of stat calls.
+    try:
+        src_stat = os.stat(Path(sys.argv[0]).resolve())
+        manifest: Optional[Dict[str, int]] = {
+            "src_mtime": src_stat.st_mtime_ns,
+            "src_size": src_stat.st_size,
+        }
+    except OSError:
+        manifest = None
+    # The manifest only short-circuits while the Startup copy is still
+    # in place; if the user deleted it, re-run the copy helper.
+    needs_copy = manifest is None or config.get("startup_manifest") != manifest
+    if not needs_copy:
+        dest = student_app._startup_dest_path('Skaphysics Homework Reminder')
+        try:
+            if dest is None:
+                needs_copy = True
+            else:
+                os.stat(dest)
+        except OSError:
+            needs_copy = True
+    if needs_copy:
+        copied = student_app.ensure_startup_copy('Skaphysics Homework Reminder')
+        # Record the manifest only when the copy verifiably exists, so
+        # a failed copy (Startup dir missing, profile offline) is
+        # retried on the next launch instead of being remembered as
+        # done.
+        if copied and manifest is not None:
+            config["startup_manifest"] = manifest
+            save_config(config_path, config)
     app = AllClassesApp(lunch_option=lunch_option)
     # Start the monitoring thread (non‑blocking)
     app.start()
     # Display a tray icon with quit option
     student_app.setup_tray_icon(app)  # reuse helper from student_app
-    # Keep the main thread alive until the app stops running
+    # Block until the monitoring thread exits; unlike the old
+    # sleep(1) poll, join() parks the main thread with no wakeups.
     try:
-        while app.running:
-            time.sleep(1)
+        if app.thread is not None:
+            app.thread.join()
     except KeyboardInterrupt:
-        app.running = False
+        app.stop()
+        if app.thread is not None:
+            app.thread.join()
 
 
 if __name__ == "__main__":
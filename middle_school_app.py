@@ -26,15 +26,17 @@ and can be customised easily.
 
 from __future__ import annotations
 
+import atexit
+import bisect
 import json
 import os
 import sys
 import threading
-import time
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime, date, timedelta, time as dttime
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, FrozenSet, List, Optional, Set, Tuple
 
 try:
     import tkinter as tk  # type: ignore
@@ -64,6 +66,7 @@ except ImportError:
 # period ordering.  The middle school follows the same seven‑day
 # rotation (A–G) as the upper school.
 from student_app import (
+    FIRST_DAY,
     LETTERS,
     PERIOD_ORDER,
     get_letter_day as upper_get_letter_day,
@@ -73,6 +76,40 @@ from student_app import (
     SCHOOLOGY_CALENDAR_URL,
 )  # type: ignore
 
+# Hidden Tk root used as the parent of every dialog in this module.
+# Starting a Tk interpreter loads Tcl, fonts and window handles, so it
+# is created once per thread on first use.  The root is thread-local
+# because Tk objects may only be used from their creating thread: the
+# setup prompts run on the main thread while the reminder dialogs run
+# on the monitoring thread, and the main thread pumps no events once
+# it parks waiting for shutdown.
+_TK_LOCAL = threading.local()
+
+
+def _destroy_tk_root() -> None:
+    """Destroy the calling thread's hidden root, if it has one."""
+    root = getattr(_TK_LOCAL, 'root', None)
+    if root is not None:
+        try:
+            root.destroy()
+        except Exception:
+            pass
+        _TK_LOCAL.root = None
+
+
+def _get_tk_root() -> "tk.Tk":
+    """Return the calling thread's hidden Tk root, creating it on first use."""
+    root = getattr(_TK_LOCAL, 'root', None)
+    if root is None:
+        root = tk.Tk()
+        root.withdraw()
+        root.attributes('-topmost', True)
+        _TK_LOCAL.root = root
+        if threading.current_thread() is threading.main_thread():
+            atexit.register(_destroy_tk_root)
+    return root
+
+
 # For the middle school, we still need the period input prompt.  Reuse a
 # simplified version of the ask_period helper from the original
 # middle school module.
@@ -84,35 +121,55 @@ def ask_period() -> int:
     """
     if tk is None or simpledialog is None or messagebox is None:
         raise RuntimeError("Tkinter is required to prompt for the period")
-    root = tk.Tk()
-    root.withdraw()
+    root = _get_tk_root()
     while True:
         result = simpledialog.askstring(
-            "Class Period", "Enter your class period number (1–7):"
+            "Class Period", "Enter your class period number (1–7):", parent=root
         )
         if result is None:
-            messagebox.showinfo("Setup", "Setup cancelled.")
-            root.destroy()
+            messagebox.showinfo("Setup", "Setup cancelled.", parent=root)
             sys.exit(0)
         try:
             value = int(result)
             if 1 <= value <= 7:
-                root.destroy()
                 return value
         except ValueError:
             pass
-        messagebox.showerror("Invalid input", "Please enter a number between 1 and 7.")
+        messagebox.showerror(
+            "Invalid input", "Please enter a number between 1 and 7.", parent=root
+        )
 
 
+@lru_cache(maxsize=1024)
 def get_letter_day(current_date: date) -> str:
-    """Return the letter day for the given date using the upper school helper."""
+    """Return the letter day for the given date using the upper school helper.
+
+    The rotation is a pure function of the date and both run loops query
+    it repeatedly, so results are memoized; a school year has fewer than
+    200 class days, well within the cache bound.
+    """
     return upper_get_letter_day(current_date)
 
 
-@dataclass
+# The letter alphabet is fixed, so materialise the period orderings as
+# tuples once instead of calling PERIOD_ORDER.get on every lookup.
+PERIOD_ORDER_BY_LETTER: Dict[str, Tuple[int, ...]] = {
+    letter: tuple(PERIOD_ORDER.get(letter, ())) for letter in LETTERS
+}
+
+
+@dataclass(frozen=True, slots=True)
 class ClassTime:
     start: dttime
     end: dttime
+    # Reminder time five minutes before the end of the block, derived
+    # once at construction.  The anchor date is shifted one day off
+    # ``date.min`` so the subtraction can never underflow.
+    reminder5: dttime = field(init=False)
+
+    def __post_init__(self) -> None:
+        dt_end = datetime.combine(date.min + timedelta(days=1), self.end)
+        object.__setattr__(self, 'reminder5', (dt_end - timedelta(minutes=5)).time())
 
     def reminder_time(self, minutes_before: int = 5) -> dttime:
         dt_end = datetime.combine(date.today(), self.end)
@@ -130,7 +187,7 @@ class ClassTime:
 # provided for completeness and future customisation.
 # ---------------------------------------------------------------------------
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class MSLunchWindow:
     start_min: int
     end_min: int
@@ -172,6 +229,29 @@ MS_LUNCH_OVERRIDES: List[Tuple[Tuple[int, int], Tuple[int, int], Dict[int, MSLun
 ]
 
 
+def _build_override_intervals() -> Tuple[Tuple[int, ...], Tuple[int, ...], Tuple[Dict[int, MSLunchWindow], ...]]:
+    """Convert the override ranges into sorted ordinal-day intervals.
+
+    Each range is anchored to the academic year starting in
+    ``FIRST_DAY.year``; an end month earlier than its start month rolls
+    into the following calendar year, so ranges straddling New Year
+    work.  The parallel tuples (starts, ends, tables) let the lookup
+    binary-search the starts regardless of how many overrides exist.
+    """
+    year = FIRST_DAY.year
+    intervals = []
+    for (sm, sd), (em, ed), table in MS_LUNCH_OVERRIDES:
+        start = date(year if sm >= FIRST_DAY.month else year + 1, sm, sd)
+        end = date(start.year + (1 if em < sm else 0), em, ed)
+        intervals.append((start.toordinal(), end.toordinal(), table))
+    intervals.sort(key=lambda iv: iv[0])
+    starts, ends, tables = zip(*intervals) if intervals else ((), (), ())
+    return starts, ends, tables
+
+
+_OVERRIDE_STARTS, _OVERRIDE_ENDS, _OVERRIDE_TABLES = _build_override_intervals()
+
+
 def get_ms_lunch_window_for(date_obj: date, grade: int) -> MSLunchWindow:
     """
     Return the lunch window for the given date and grade.  If the date
@@ -179,15 +259,10 @@ def get_ms_lunch_window_for(date_obj: date, grade: int) -> MSLunchWindow:
     return the regular mapping.  If a grade is not found, fall back
     to a default (grade 8) window.
     """
-    m, d = date_obj.month, date_obj.day
-    for (start_md, end_md, table) in MS_LUNCH_OVERRIDES:
-        (sm, sd), (em, ed) = start_md, end_md
-        in_range = (
-            (m > sm or (m == sm and d >= sd)) and
-            (m < em or (m == em and d <= ed))
-        )
-        if in_range and grade in table:
-            return table[grade]
+    o = date_obj.toordinal()
+    i = bisect.bisect_right(_OVERRIDE_STARTS, o) - 1
+    if i >= 0 and o <= _OVERRIDE_ENDS[i] and grade in _OVERRIDE_TABLES[i]:
+        return _OVERRIDE_TABLES[i][grade]
     return MS_LUNCH_WINDOWS_REGULAR.get(grade, MS_LUNCH_WINDOWS_REGULAR[8])
 
 
@@ -200,49 +275,96 @@ def get_ms_lunch_window_for(date_obj: date, grade: int) -> MSLunchWindow:
 # particular day of the week.
 # ---------------------------------------------------------------------------
 
-def get_schedule_for_day(day_of_week: int) -> List[ClassTime]:
+def _build_day_schedule(day_of_week: int) -> Tuple[ClassTime, ...]:
     """
-    Return a list of class times for the given weekday index (0=Mon … 6=Sun).
+    Construct the block times for the given weekday index (0=Mon … 6=Sun).
     The middle school schedule varies by day.  Wednesday starts late;
     Thursday starts early.  On other days (Mon/Tue/Fri) the schedule
     follows a standard pattern【810082011620849†L330-L345】【810082011620849†L347-L368】.
     """
     if day_of_week == 2:  # Wednesday
-        return [
+        return (
             ClassTime(dttime(8, 55), dttime(9, 50)),
             ClassTime(dttime(9, 55), dttime(10, 50)),
             ClassTime(dttime(11, 10), dttime(12, 5)),
             ClassTime(dttime(13, 5), dttime(14, 0)),
             ClassTime(dttime(14, 5), dttime(15, 0)),
-        ]
+        )
     elif day_of_week == 3:  # Thursday
-        return [
+        return (
             ClassTime(dttime(8, 30), dttime(9, 25)),
             ClassTime(dttime(9, 30), dttime(10, 25)),
             ClassTime(dttime(11, 10), dttime(12, 5)),
             ClassTime(dttime(13, 5), dttime(14, 0)),
             ClassTime(dttime(14, 5), dttime(15, 0)),
-        ]
+        )
     else:  # Monday, Tuesday, Friday
-        return [
+        return (
             ClassTime(dttime(8, 45), dttime(9, 40)),
             ClassTime(dttime(9, 45), dttime(10, 40)),
             ClassTime(dttime(11, 10), dttime(12, 5)),
             ClassTime(dttime(13, 5), dttime(14, 0)),
             ClassTime(dttime(14, 5), dttime(15, 0)),
-        ]
+        )
+
+
+# All seven weekday schedules, materialised once at import so every
+# later lookup is a plain tuple index with no allocation.
+SCHEDULES: Tuple[Tuple[ClassTime, ...], ...] = tuple(
+    _build_day_schedule(w) for w in range(7)
+)
+
+
+def get_schedule_for_day(day_of_week: int) -> Tuple[ClassTime, ...]:
+    """Return the class times for the given weekday index (0=Mon, 6=Sun)."""
+    return SCHEDULES[day_of_week]
+
+
+def _build_next_meetings() -> Dict[int, List[Tuple[date, ClassTime]]]:
+    """Precompute every meeting of each period for the academic year.
+
+    Walks the school calendar once at import and records, per period,
+    the dates on which it meets together with the block time.  Lookups
+    can then bisect straight to the first meeting after a given date
+    instead of re-walking the rotation day by day on every call.
+    """
+    meetings: Dict[int, List[Tuple[date, ClassTime]]] = {p: [] for p in range(1, 8)}
+    d = FIRST_DAY
+    end = FIRST_DAY + timedelta(days=365)
+    while d <= end:
+        if d.weekday() < 5:
+            order = PERIOD_ORDER_BY_LETTER.get(get_letter_day(d), ())
+            schedule = get_schedule_for_day(d.weekday())
+            for idx, period in enumerate(order):
+                if idx < len(schedule):
+                    meetings[period].append((d, schedule[idx]))
+        d += timedelta(days=1)
+    return meetings
+
+
+_NEXT_MEETINGS: Dict[int, List[Tuple[date, ClassTime]]] = _build_next_meetings()
+# Parallel sorted date lists for bisecting into _NEXT_MEETINGS.
+_MEETING_DATES: Dict[int, List[date]] = {
+    period: [d for d, _ in meetings] for period, meetings in _NEXT_MEETINGS.items()
+}
 
 
 def get_next_class_ms(period: int, from_date: date) -> Optional[Tuple[date, ClassTime]]:
     """
     Find the next date and time slot when ``period`` meets in the middle school.
 
-    Starting one day after ``from_date``, search forward (skipping
-    weekends) until the letter rotation includes the requested period.
-    Return a tuple of (date, ClassTime).  This function reuses the
-    upper school period ordering and letter rotation to determine
-    which periods meet on each letter day.
+    Answers from the precomputed per-period meeting table via a binary
+    search; when ``from_date`` lies beyond the precomputed horizon the
+    original day-by-day walk over the letter rotation is used as a
+    fallback.  Return a tuple of (date, ClassTime).
     """
+    meetings = _NEXT_MEETINGS.get(period)
+    if meetings:
+        dates = _MEETING_DATES[period]
+        i = bisect.bisect_right(dates, from_date)
+        if i < len(dates):
+            return meetings[i]
+    # Fallback: walk forward one day at a time, skipping weekends.
     next_date = from_date + timedelta(days=1)
     while True:
         # Skip weekends
@@ -250,7 +372,7 @@ def get_next_class_ms(period: int, from_date: date) -> Optional[Tuple[date, Clas
             next_date += timedelta(days=1)
             continue
         letter = get_letter_day(next_date)
-        order = PERIOD_ORDER.get(letter, [])
+        order = PERIOD_ORDER_BY_LETTER.get(letter, ())
         if period in order:
             idx = order.index(period)
             slots = get_schedule_for_day(next_date.weekday())
@@ -279,17 +401,15 @@ def prompt_for_ms_grade_and_lunch() -> Dict[str, object]:
     """
     if tk is None or simpledialog is None or messagebox is None:
         raise RuntimeError("Tkinter is required for grade and lunch prompts")
-    root = tk.Tk()
-    root.withdraw()
+    root = _get_tk_root()
     grade: Optional[int] = None
     # Ask for grade until valid
     while grade not in (6, 7, 8):
         res = simpledialog.askstring(
-            "Grade Level", "Enter your grade (6, 7, or 8):"
+            "Grade Level", "Enter your grade (6, 7, or 8):", parent=root
         )
         if res is None:
-            messagebox.showinfo("Setup", "Setup cancelled.")
-            root.destroy()
+            messagebox.showinfo("Setup", "Setup cancelled.", parent=root)
             sys.exit(0)
         try:
             g = int(res)
@@ -298,11 +418,12 @@ def prompt_for_ms_grade_and_lunch() -> Dict[str, object]:
         except ValueError:
             pass
         if grade is None:
-            messagebox.showerror("Invalid input", "Please enter 6, 7, or 8.")
+            messagebox.showerror("Invalid input", "Please enter 6, 7, or 8.", parent=root)
     # Ask whether the day uses split lunch
     uses_split = messagebox.askyesno(
         "Lunch Schedule",
         "Does your grade use split lunch (first/second lunch)?",
+        parent=root,
     )
     lunch_choice = "first"
     if uses_split:
@@ -311,192 +432,177 @@ def prompt_for_ms_grade_and_lunch() -> Dict[str, object]:
             ans = simpledialog.askstring(
                 "Lunch Choice",
                 "Do you have first or second lunch? (type 'first' or 'second')",
+                parent=root,
             )
             if ans is None:
-                messagebox.showinfo("Setup", "Setup cancelled.")
-                root.destroy()
+                messagebox.showinfo("Setup", "Setup cancelled.", parent=root)
                 sys.exit(0)
             if ans:
                 lunch_choice = ans.strip().lower()
         # Standardise
         lunch_choice = lunch_choice.lower()
-    root.destroy()
     return {"grade": grade, "lunch_choice": lunch_choice}
 
 
-class StudentReminderApp:
-    """Monitor a single class period for middle school."""
+def _todays_reminders(day: date) -> List[Tuple[datetime, int, int, ClassTime]]:
+    """Return the reminder schedule for ``day``, sorted by time.
 
-    def __init__(self, period: int, check_interval: int = 30) -> None:
-        self.period = period
-        self.check_interval = check_interval
-        self.running = True
-        self.thread: Optional[threading.Thread] = None
+    Builds ``(reminder_dt, period_number, slot_idx, class_time)``
+    entries by zipping the letter-day period ordering with the day's
+    block times; ``slot_idx`` is the block's position in the day so
+    consumers never have to search the schedule for it again.  The list
+    is empty on weekends, so callers can simply sleep through to the
+    next midnight when nothing is returned.
+    """
+    if day.weekday() >= 5:
+        return []
+    letter = get_letter_day(day)
+    order = PERIOD_ORDER_BY_LETTER.get(letter, ())
+    schedule = get_schedule_for_day(day.weekday())
+    entries: List[Tuple[datetime, int, int, ClassTime]] = []
+    for idx, class_time in enumerate(schedule):
+        if idx >= len(order):
+            break
+        entries.append(
+            (datetime.combine(day, class_time.reminder5), order[idx], idx, class_time)
+        )
+    entries.sort(key=lambda entry: entry[0])
+    return entries
 
-    def start(self) -> None:
-        """Start the background monitoring thread without blocking."""
-        if self.thread is None or not self.thread.is_alive():
-            self.thread = threading.Thread(target=self._run_loop, daemon=True)
-            self.thread.start()
 
-    def _run_loop(self) -> None:
-        while self.running:
-            now = datetime.now()
-            # Only operate on weekdays
-            if now.weekday() < 5:
-                letter = get_letter_day(now.date())
-                order = PERIOD_ORDER.get(letter, [])
-                # If the student's period meets today, determine its time slot
-                if self.period in order:
-                    idx = order.index(self.period)
-                    schedule = get_schedule_for_day(now.weekday())
-                    if idx < len(schedule):
-                        class_time = schedule[idx]
-                        reminder = class_time.reminder_time(5)
-                        if (
-                            now.time().hour == reminder.hour
-                            and now.time().minute == reminder.minute
-                        ):
-                            self.show_reminder(now.date(), class_time)
-                            # Wait a minute to avoid duplicate prompts
-                            time.sleep(60)
-                            continue
-            time.sleep(self.check_interval)
-
-    def show_reminder(self, class_date: date, class_time: ClassTime) -> None:
-        if tk is None:
-            return
-        root = tk.Tk()
-        root.withdraw()
-        root.attributes('-topmost', True)
-        result = messagebox.askyesno(
-            title="Homework Reminder",
-            message="Do you have homework for tonight?",
-            parent=root,
-        )
-        root.destroy()
-        if result:
-            # Determine ordinal of the current class block (1st–5th)
-            try:
-                schedule = get_schedule_for_day(class_date.weekday())
-                ordinal = int_to_ordinal(schedule.index(class_time) + 1)
-            except Exception:
-                ordinal = None
-            # Compute the next class occurrence using the rotation
-            next_info = get_next_class_ms(self.period, class_date)
-            if next_info is not None:
-                next_date, next_time = next_info
-                start_dt = datetime.combine(next_date, next_time.start)
-                end_dt = datetime.combine(next_date, next_time.end)
-                subject = f"{ordinal} Period HW due" if ordinal else None
-                self.create_outlook_event(start_dt, end_dt, subject=subject)
+def _fmt_appt(dt: datetime) -> str:
+    """Format a datetime the way Outlook expects (``MM/DD/YYYY HH:MM``).
 
-    def create_outlook_event(
-        self,
-        start_dt: datetime,
-        end_dt: datetime,
-        subject: Optional[str] = None,
-    ) -> None:
-        """
-        Create a calendar appointment with a 60‑minute reminder.
+    Built from the integer components directly; ``strftime`` would go
+    through the C locale machinery for the same fixed layout.
+    """
+    return f"{dt.month:02d}/{dt.day:02d}/{dt.year} {dt.hour:02d}:{dt.minute:02d}"
 
-        The subject defaults to "Homework" if not provided.  The body
-        is left blank, and after displaying the appointment the
-        Schoology calendar is opened.  Any Outlook errors are ignored.
-        """
-        if win32com is None or pythoncom is None:
-            return
-        try:
-            pythoncom.CoInitialize()
-            outlook = win32com.Dispatch('Outlook.Application')
-            appt = outlook.CreateItem(1)
-            appt.Start = start_dt.strftime("%m/%d/%Y %H:%M")
-            appt.End = end_dt.strftime("%m/%d/%Y %H:%M")
-            appt.Subject = subject or "Homework"
-            appt.Body = ""
-            appt.ReminderSet = True
-            appt.ReminderMinutesBeforeStart = 60
-            appt.Display(True)
-            try:
-                webbrowser.open_new_tab(SCHOOLOGY_CALENDAR_URL)
-            except Exception:
-                pass
-        except Exception:
-            pass
 
+class ReminderApp:
+    """Monitor a set of class periods for middle school.
 
-class AllClassesReminderApp:
-    """Monitor every period each day for middle school."""
+    The single-period and all-periods entry points share this one
+    dispatcher; they differ only in which periods are watched, so the
+    per-day schedule work and the reminder loop run in a single place.
+    """
 
-    def __init__(self, check_interval: int = 30) -> None:
+    def __init__(self, watched: FrozenSet[int], check_interval: int = 30) -> None:
+        self.watched = watched
+        # Retained for call-site compatibility only; the scheduled
+        # sleep below no longer polls on an interval.
         self.check_interval = check_interval
-        self.running = True
+        # Shutdown is signalled through an event so idle waits can be
+        # interrupted immediately instead of timing out first.
+        self._stop = threading.Event()
         self.thread: Optional[threading.Thread] = None
-        # Track whether a reminder has already fired for (date, period)
-        self.triggered: Dict[Tuple[date, int], bool] = {}
+        # Cached Outlook.Application handle; Dispatch is expensive, so
+        # it is created once on first use and dropped on COM errors.
+        self._outlook = None
+        self._com_initialized = False
+        # Periods that have already prompted today; the set is cleared
+        # once when the date rolls over rather than rebuilt per pass.
+        self.triggered: Set[int] = set()
+        self._last_reset: date = date.today()
+
+    @property
+    def running(self) -> bool:
+        return not self._stop.is_set()
+
+    @running.setter
+    def running(self, value: bool) -> None:
+        if value:
+            self._stop.clear()
+        else:
+            self._stop.set()
+
+    def stop(self) -> None:
+        """Signal the monitoring thread to exit and wake any waits."""
+        self._stop.set()
 
     def start(self) -> None:
+        """Start the background monitoring thread without blocking."""
         if self.thread is None or not self.thread.is_alive():
             self.thread = threading.Thread(target=self._run_loop, daemon=True)
             self.thread.start()
 
     def _run_loop(self) -> None:
+        try:
+            self._monitor()
+        finally:
+            # Destroy this thread's hidden root (if any dialogs were
+            # shown) on the thread that owns it.
+            _destroy_tk_root()
+
+    def _monitor(self) -> None:
+        cached_day: Optional[date] = None
+        pending: List[Tuple[datetime, int, int, ClassTime]] = []
         while self.running:
             now = datetime.now()
             # Discard triggers from previous days
-            self.triggered = {
-                (d, p): fired
-                for (d, p), fired in self.triggered.items()
-                if d == now.date()
-            }
-            if now.weekday() < 5:
-                letter = get_letter_day(now.date())
-                order = PERIOD_ORDER.get(letter, [])
-                schedule = get_schedule_for_day(now.weekday())
-                for idx, class_time in enumerate(schedule):
-                    if idx >= len(order):
-                        break
-                    period_number = order[idx]
-                    reminder = class_time.reminder_time(5)
-                    key = (now.date(), period_number)
-                    if (
-                        now.time().hour == reminder.hour
-                        and now.time().minute == reminder.minute
-                        and not self.triggered.get(key, False)
-                    ):
-                        self.triggered[key] = True
-                        self.show_reminder(now.date(), period_number, class_time)
-                        # Wait a minute to avoid duplicate prompts
-                        time.sleep(60)
-                        break
-            time.sleep(self.check_interval)
+            today = now.date()
+            if today != self._last_reset:
+                self.triggered.clear()
+                self._last_reset = today
+            # Rebuild the day's reminder list when the date changes
+            if cached_day != now.date():
+                cached_day = now.date()
+                pending = [
+                    entry
+                    for entry in _todays_reminders(cached_day)
+                    if entry[1] in self.watched and entry[0] > now
+                ]
+            if not pending:
+                # Nothing left today (or weekend): sleep until the next
+                # midnight, then rebuild for the new date.
+                next_midnight = datetime.combine(
+                    cached_day + timedelta(days=1), dttime.min
+                )
+                if self._stop.wait(max(0.0, (next_midnight - now).total_seconds())):
+                    break
+                continue
+            head_dt, period_number, slot_idx, class_time = pending[0]
+            wait = (head_dt - datetime.now()).total_seconds()
+            if wait > 0 and self._stop.wait(wait):
+                break
+            # Guard against wall-clock jumps: only fire once the
+            # reminder time has genuinely been reached.
+            if datetime.now() < head_dt:
+                continue
+            pending.pop(0)
+            if not self.running:
+                break
+            if period_number in self.triggered:
+                continue
+            self.triggered.add(period_number)
+            self.show_reminder(head_dt.date(), period_number, class_time, slot_idx)
 
     def show_reminder(
         self,
         class_date: date,
         period_index: int,
         class_time: ClassTime,
+        slot_idx: int,
     ) -> None:
         if tk is None:
             return
-        root = tk.Tk()
-        root.withdraw()
-        root.attributes('-topmost', True)
-        result = messagebox.askyesno(
-            title="Homework Reminder",
-            message=(
+        if len(self.watched) == 1:
+            message = "Do you have homework for tonight?"
+        else:
+            message = (
                 f"Class period {period_index} is ending soon.  "
                 "Do you have homework?"
-            ),
-            parent=root,
+            )
+        result = messagebox.askyesno(
+            title="Homework Reminder",
+            message=message,
+            parent=_get_tk_root(),
         )
-        root.destroy()
         if result:
-            try:
-                schedule = get_schedule_for_day(class_date.weekday())
-                ordinal = int_to_ordinal(schedule.index(class_time) + 1)
-            except Exception:
-                ordinal = None
+            # Ordinal of the current class block (1st–5th), from the
+            # slot position already known to the scheduler.
+            ordinal = int_to_ordinal(slot_idx + 1)
+            # Compute the next class occurrence using the rotation
             next_info = get_next_class_ms(period_index, class_date)
             if next_info is not None:
                 next_date, next_time = next_info
@@ -512,14 +618,25 @@ class AllClassesReminderApp:
         end_dt: datetime,
         subject: Optional[str] = None,
     ) -> None:
+        """
+        Create a calendar appointment with a 60‑minute reminder.
+
+        The subject defaults to a per-period homework title if not
+        provided.  The body is left blank, and after displaying the
+        appointment the Schoology calendar is opened.  Any Outlook
+        errors are ignored.
+        """
         if win32com is None or pythoncom is None:
             return
         try:
-            pythoncom.CoInitialize()
-            outlook = win32com.Dispatch('Outlook.Application')
-            appt = outlook.CreateItem(1)
-            appt.Start = start_dt.strftime("%m/%d/%Y %H:%M")
-            appt.End = end_dt.strftime("%m/%d/%Y %H:%M")
+            if self._outlook is None:
+                if not self._com_initialized:
+                    pythoncom.CoInitialize()
+                    self._com_initialized = True
+                self._outlook = win32com.client.Dispatch('Outlook.Application')
+            appt = self._outlook.CreateItem(1)
+            appt.Start = _fmt_appt(start_dt)
+            appt.End = _fmt_appt(end_dt)
             appt.Subject = subject if subject else f"Homework – Period {period_index}"
             appt.Body = ""
             appt.ReminderSet = True
@@ -530,7 +647,57 @@ class AllClassesReminderApp:
             except Exception:
                 pass
         except Exception:
-            pass
+            # Drop the cached handle so a restarted Outlook gets a
+            # fresh Dispatch on the next reminder.
+            self._outlook = None
+
+
+# Most recently parsed config, keyed by path and file mtime, so an
+# unchanged file is never re-parsed.
+_CFG_CACHE: Optional[Tuple[str, int, Dict[str, object]]] = None
+
+
+def _load_config(config_path: Path) -> Dict[str, object]:
+    """Read the JSON configuration, reusing the cached parse if fresh.
+
+    A single stat call decides whether the cached dictionary can be
+    returned; a copy is handed out so callers mutating the result do
+    not corrupt the cache.  Missing or unreadable files yield ``{}``.
+    """
+    global _CFG_CACHE
+    try:
+        mtime_ns = os.stat(config_path).st_mtime_ns
+    except OSError:
+        return {}
+    if _CFG_CACHE is not None:
+        cached_path, cached_mtime, cached_cfg = _CFG_CACHE
+        if cached_path == str(config_path) and cached_mtime == mtime_ns:
+            return dict(cached_cfg)
+    try:
+        with config_path.open('r', encoding='utf-8') as f:
+            config = json.load(f)
+    except Exception:
+        return {}
+    _CFG_CACHE = (str(config_path), mtime_ns, dict(config))
+    return config
+
+
+def _save_config(config_path: Path, config: Dict[str, object], previous: Dict[str, object]) -> None:
+    """Write the configuration to disk unless nothing changed.
+
+    ``previous`` is the dictionary as loaded; an equal ``config`` means
+    the launch only re-read existing values and the disk write (and
+    cache invalidation) can be skipped entirely.
+    """
+    global _CFG_CACHE
+    if config == previous:
+        return
+    with config_path.open('w', encoding='utf-8') as f:
+        json.dump(config, f, indent=2)
+    try:
+        _CFG_CACHE = (str(config_path), os.stat(config_path).st_mtime_ns, dict(config))
+    except OSError:
+        _CFG_CACHE = None
 
 
 def run_student_app() -> None:
@@ -541,15 +708,10 @@ def run_student_app() -> None:
     the Startup folder so it runs at login.
     """
     config_dir = Path(os.environ.get('APPDATA', Path.home())) / 'SkaphysicsHomeworkReminder'
-config_dir.mkdir(parents=True, exist_ok=True)
-config_path = config_dir / 'student_config.json'
-    config: Dict[str, object] = {}
-    if config_path.exists():
-        try:
-            with config_path.open('r', encoding='utf-8') as f:
-                config = json.load(f)
-        except Exception:
-            config = {}
+    config_dir.mkdir(parents=True, exist_ok=True)
+    config_path = config_dir / 'student_config.json'
+    config = _load_config(config_path)
+    original = dict(config)
     period = config.get('period')  # type: ignore
     grade = config.get('grade')    # type: ignore
     lunch_choice = config.get('lunch_choice')  # type: ignore
@@ -562,11 +724,10 @@ config_path = config_dir / 'student_config.json'
         info = prompt_for_ms_grade_and_lunch()
         config['grade'] = info['grade']
         config['lunch_choice'] = info['lunch_choice']
-    # Save configuration
-    with config_path.open('w', encoding='utf-8') as f:
-        json.dump(config, f, indent=2)
+    # Save configuration (no-op when nothing was prompted for)
+    _save_config(config_path, config, original)
     # Start the reminder app
-    app = StudentReminderApp(period=int(period))
+    app = ReminderApp(frozenset({int(period)}))
     # Copy script/executable into startup folder (reuse helper from student_app)
     ensure_startup_copy('Skaphysics Homework Reminder')
     # Start monitoring thread (non-blocking)
@@ -575,10 +736,9 @@ config_path = config_dir / 'student_config.json'
     setup_tray_icon(app)
     # Keep main thread alive until user quits
     try:
-        while app.running:
-            time.sleep(1)
+        app._stop.wait()
     except KeyboardInterrupt:
-        app.running = False
+        app.stop()
 
 
 def run_all_classes_app() -> None:
@@ -586,30 +746,23 @@ def run_all_classes_app() -> None:
     base_dir = Path(__file__).resolve().parent
     config_path = base_dir / "middle_school_config.json"
     # Ensure grade/lunch information is recorded even if unused
-    config: Dict[str, object] = {}
-    if config_path.exists():
-        try:
-            with config_path.open('r', encoding='utf-8') as f:
-                config = json.load(f)
-        except Exception:
-            config = {}
+    config = _load_config(config_path)
+    original = dict(config)
     grade = config.get('grade')    # type: ignore
     lunch_choice = config.get('lunch_choice')  # type: ignore
     if grade is None or lunch_choice is None:
         info = prompt_for_ms_grade_and_lunch()
         config['grade'] = info['grade']
         config['lunch_choice'] = info['lunch_choice']
-        with config_path.open('w', encoding='utf-8') as f:
-            json.dump(config, f, indent=2)
-    app = AllClassesReminderApp()
+    _save_config(config_path, config, original)
+    app = ReminderApp(frozenset(range(1, 8)))
     ensure_startup_copy('Skaphysics Homework Reminder')
     app.start()
     setup_tray_icon(app)
     try:
-        while app.running:
-            time.sleep(1)
+        app._stop.wait()
     except KeyboardInterrupt:
-        app.running = False
+        app.stop()
 
 
 if __name__ == '__main__':
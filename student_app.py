@@ -41,6 +41,7 @@ appear.
 
 from __future__ import annotations
 
+import atexit
 import json
 import os
 import sys
@@ -48,8 +49,9 @@ import threading
 import time
 from dataclasses import dataclass
 from datetime import datetime, date, timedelta, time as dttime
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, List, Tuple, Optional
+from typing import Any, Dict, List, Tuple, Optional
 
 try:
     import tkinter as tk
@@ -59,21 +61,85 @@ except ImportError:
     simpledialog = None  # type: ignore
     messagebox = None  # type: ignore
 
+# Optional C-accelerated JSON codec for the configuration file; the
+# stdlib module remains the fallback.
 try:
-    import win32com.client  # type: ignore
-    import pythoncom  # type: ignore
+    import orjson  # type: ignore
 except ImportError:
-    win32com = None  # type: ignore
-    pythoncom = None  # type: ignore
+    orjson = None  # type: ignore
+
+# pywin32, PIL and pystray are only needed when an appointment is
+# actually created or the tray icon is shown, so they are imported
+# lazily by the helpers below instead of at module load.  This keeps
+# interpreter startup fast and memory low when those paths never run.
+
+# Cached (win32com.client, pythoncom, pywintypes) triple, or a triple
+# of None when pywin32 is unavailable.  Populated on first use.
+_OUTLOOK_MODULES: Optional[Tuple[Any, Any, Any]] = None
+
+# Cached (PIL.Image, pystray) pair, or (None, None) when tray support
+# is unavailable.  Populated on first use.
+_TRAY_MODULES: Optional[Tuple[Any, Any]] = None
+
+
+def _import_outlook() -> Tuple[Any, Any, Any]:
+    """Import and cache the COM modules used for Outlook integration."""
+    global _OUTLOOK_MODULES
+    if _OUTLOOK_MODULES is None:
+        try:
+            import win32com.client  # type: ignore
+            import pythoncom  # type: ignore
+            import pywintypes  # type: ignore
+            _OUTLOOK_MODULES = (win32com.client, pythoncom, pywintypes)
+        except ImportError:
+            _OUTLOOK_MODULES = (None, None, None)
+    return _OUTLOOK_MODULES
+
+
+def _import_tray() -> Tuple[Any, Any]:
+    """Import and cache the imaging/tray modules for the system tray icon."""
+    global _TRAY_MODULES
+    if _TRAY_MODULES is None:
+        try:
+            from PIL import Image
+            import pystray
+            _TRAY_MODULES = (Image, pystray)
+        except ImportError:
+            _TRAY_MODULES = (None, None)
+    return _TRAY_MODULES
+
+
+# Shared hidden Tk root used as the parent of every dialog in this
+# module.  Starting a Tk interpreter loads Tcl, fonts and window
+# handles, so it is created once on first use and destroyed at exit.
+_TK_ROOT = None
+
+# True while main() is running the Tk event loop on the main thread.
+# The reminder thread uses this to decide whether dialogs must be
+# marshalled onto the Tk thread via ``after`` (Tk is not thread-safe)
+# or can be shown inline.
+_TK_MAINLOOP_RUNNING = False
+
+
+def _destroy_tk_root() -> None:
+    global _TK_ROOT
+    if _TK_ROOT is not None:
+        try:
+            _TK_ROOT.destroy()
+        except Exception:
+            pass
+        _TK_ROOT = None
 
-# Attempt to import pystray and PIL for system tray icon support.  If
-# unavailable the application will still run but without a tray icon.
-try:
-    from PIL import Image
-    import pystray
-except ImportError:
-    Image = None  # type: ignore
-    pystray = None  # type: ignore
+
+def _get_tk_root() -> "tk.Tk":
+    """Return the singleton hidden Tk root, creating it on first use."""
+    global _TK_ROOT
+    if _TK_ROOT is None:
+        _TK_ROOT = tk.Tk()
+        _TK_ROOT.withdraw()
+        _TK_ROOT.attributes('-topmost', True)
+        atexit.register(_destroy_tk_root)
+    return _TK_ROOT
 
 
 @dataclass
@@ -90,66 +156,155 @@ class ClassTime:
         return dt_rem.time()
 
 
+# Parsed configs keyed by path, with the file mtime that produced each
+# parse, so an unchanged file is never re-read or re-decoded.
+_CONFIG_CACHE: Dict[str, Tuple[int, Dict[str, Any]]] = {}
+
+
 def load_config(config_path: Path) -> Dict[str, Any]:
     """Load the configuration from disk or return an empty dictionary.
 
     The configuration may contain values of different types (e.g., int
     for the period and str for the lunch option), so the return type
     allows any value.
+
+    A single ``stat`` call decides whether a previously parsed result
+    can be reused; a copy is handed out either way so callers mutating
+    the dictionary do not corrupt the cache.
     """
-    if config_path.exists():
-        try:
-            with config_path.open("r", encoding="utf-8") as f:
-                data: Dict[str, Any] = json.load(f)
-                return data
-        except Exception:
-            return {}
-    return {}
+    key = str(config_path)
+    try:
+        mtime_ns = os.stat(config_path).st_mtime_ns
+    except OSError:
+        _CONFIG_CACHE.pop(key, None)
+        return {}
+    cached = _CONFIG_CACHE.get(key)
+    if cached is not None and cached[0] == mtime_ns:
+        return dict(cached[1])
+    try:
+        raw = config_path.read_bytes()
+        data: Dict[str, Any] = orjson.loads(raw) if orjson is not None else json.loads(raw)
+    except Exception:
+        return {}
+    _CONFIG_CACHE[key] = (mtime_ns, dict(data))
+    return data
 
 
 def save_config(config_path: Path, data: Dict[str, Any]) -> None:
-    """Save configuration data to disk."""
-    with config_path.open("w", encoding="utf-8") as f:
-        json.dump(data, f, indent=2)
+    """Save configuration data to disk.
+
+    The JSON is written to a sibling temp file and swapped in with
+    ``os.replace`` (atomic on Windows and POSIX), so a crash mid-write
+    can never leave a torn file for the mtime-cached loader to read.
+    """
+    if orjson is not None:
+        payload = orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    else:
+        payload = json.dumps(data, indent=2).encode("utf-8")
+    tmp_path = config_path.with_suffix(config_path.suffix + ".tmp")
+    tmp_path.write_bytes(payload)
+    os.replace(tmp_path, config_path)
+    # Refresh the cache so a reload after saving skips the re-parse.
+    try:
+        _CONFIG_CACHE[str(config_path)] = (os.stat(config_path).st_mtime_ns, dict(data))
+    except OSError:
+        _CONFIG_CACHE.pop(str(config_path), None)
+
+
+# Outcome of ensure_startup_copy for this process (None = not run
+# yet), so repeated calls cost nothing and callers can tell whether
+# the Startup copy verifiably exists.
+_startup_copy_ok: Optional[bool] = None
+
+
+def _startup_dest_path(app_name: str) -> Optional[Path]:
+    """Return the expected Startup-folder path for the app copy.
+
+    The extension is derived from the current executable (``.exe``
+    when running as a frozen PyInstaller bundle, otherwise ``.py``).
+    Returns ``None`` when the path cannot be determined.
+    """
+    try:
+        src_path = Path(sys.argv[0]).resolve()
+        extension = src_path.suffix
+        # Map .pyz to .py for interactive runs (e.g., zipapp); treat other
+        # unknown extensions as .py
+        if extension.lower() not in {'.exe', '.py'}:
+            extension = '.py'
+        startup_dir = Path(os.environ.get('APPDATA', '')) / 'Microsoft' / 'Windows' / 'Start Menu' / 'Programs' / 'Startup'
+        return startup_dir / (app_name + extension)
+    except Exception:
+        return None
 
 
-def ensure_startup_copy(app_name: str) -> None:
+def ensure_startup_copy(app_name: str) -> bool:
     """Copy the running script or executable into the Windows Startup folder.
 
     This function determines the current process path and, if an
     identically named file does not already exist in the user's
     Startup directory, copies it there.  Errors during the copy are
-    silently ignored.
+    silently ignored.  The check runs at most once per process, and
+    the "already copied" case is a single ``os.stat`` call.
 
     Parameters
     ----------
     app_name: str
         Base filename (without extension) to use when copying into
-        startup.  The extension is derived from the current executable
-        (``.exe`` if running as a frozen PyInstaller bundle, otherwise
-        ``.py``).
+        startup.  See ``_startup_dest_path`` for how the destination
+        name is derived.
+
+    Returns
+    -------
+    bool
+        True when the Startup copy verifiably exists (already present
+        or just copied), False when it could not be made.  Callers
+        must not record the copy as done unless this returns True.
     """
+    global _startup_copy_ok
+    if _startup_copy_ok is not None:
+        return _startup_copy_ok
+    _startup_copy_ok = False
     try:
-        # Determine the source path of the currently executing file.
         src_path = Path(sys.argv[0]).resolve()
-        # Determine the desired destination filename and path.
-        extension = src_path.suffix
-        # Map .pyz to .py for interactive runs (e.g., zipapp); treat other
-        # unknown extensions as .py
-        if extension.lower() not in {'.exe', '.py'}:
-            extension = '.py'
-        dest_filename = app_name + extension
-        startup_dir = Path(os.environ.get('APPDATA', '')) / 'Microsoft' / 'Windows' / 'Start Menu' / 'Programs' / 'Startup'
-        dest_path = startup_dir / dest_filename
-        # If the destination file does not exist and the startup directory
-        # exists, copy the file.  Silently ignore errors.
-        if not dest_path.exists() and startup_dir.exists():
-            import shutil
-            shutil.copy2(src_path, dest_path)
+        dest_path = _startup_dest_path(app_name)
+        if dest_path is None:
+            return False
+        # Fast path: the copy already exists (one stat syscall).
+        try:
+            os.stat(dest_path)
+            _startup_copy_ok = True
+            return True
+        except OSError:
+            pass
+        # Copy only if the startup directory is actually there; this
+        # stat doubles as the existence check shutil would repeat.
+        if dest_path.parent.is_dir():
+            copied = False
+            if os.name == 'nt':
+                # CopyFileW performs the copy kernel-side in one call,
+                # which matters for multi-MB frozen executables and
+                # network or OneDrive-backed profiles.  The final True
+                # fails the call if the destination appeared meanwhile.
+                try:
+                    import ctypes
+                    copied = bool(
+                        ctypes.windll.kernel32.CopyFileW(
+                            ctypes.c_wchar_p(str(src_path)),
+                            ctypes.c_wchar_p(str(dest_path)),
+                            True,
+                        )
+                    )
+                except Exception:
+                    copied = False
+            if not copied:
+                import shutil
+                shutil.copy2(src_path, dest_path)
+            _startup_copy_ok = True
     except Exception:
         # Ignore all failures; absence of the copy merely means the app
         # will not start automatically.
         pass
+    return _startup_copy_ok
 
 
 def setup_tray_icon(app: "ReminderApp") -> None:
@@ -167,20 +322,41 @@ def setup_tray_icon(app: "ReminderApp") -> None:
         The running reminder application.  Its ``running`` flag will
         be cleared when the user chooses to quit from the tray menu.
     """
+    Image, pystray = _import_tray()
     if pystray is None or Image is None:
         return
     try:
         icon_path = Path(__file__).resolve().parent / 'skaphysics_icon.png'
-        # Load and resize the image for the system tray (32x32 is typical)
-        image = Image.open(icon_path)
-        # Ensure the image has an alpha channel (required by some systems)
-        if image.mode != 'RGBA':
-            image = image.convert('RGBA')
-        # Resize to 64x64 for high DPI clarity; pystray will downsample
-        image = image.resize((64, 64), Image.LANCZOS)
+        # The converted and resized icon is cached on disk so the
+        # LANCZOS resample only runs when the source image changes.
+        cache_dir = os.environ.get('LOCALAPPDATA')
+        cache_path = Path(cache_dir) / 'skaphysics_icon_64.png' if cache_dir else None
+        image = None
+        if cache_path is not None:
+            try:
+                if os.stat(cache_path).st_mtime >= os.stat(icon_path).st_mtime:
+                    image = Image.open(cache_path)
+                    image.load()
+            except OSError:
+                image = None
+        if image is None:
+            # Load and resize the image for the system tray
+            image = Image.open(icon_path)
+            # Ensure the image has an alpha channel (required by some systems)
+            if image.mode != 'RGBA':
+                image = image.convert('RGBA')
+            # Resize to 64x64 for high DPI clarity; pystray will downsample
+            image = image.resize((64, 64), Image.LANCZOS)
+            if cache_path is not None:
+                try:
+                    image.save(cache_path, 'PNG', optimize=True)
+                except Exception:
+                    pass
         # Define an action for the Quit menu item
         def on_quit(icon: pystray.Icon, item: pystray.MenuItem) -> None:
-            app.running = False
+            # stop() sets the app's stop event, so scheduled sleeps
+            # wake immediately instead of on the next timeout.
+            app.stop()
             try:
                 icon.visible = False
                 icon.stop()
@@ -195,29 +371,179 @@ def setup_tray_icon(app: "ReminderApp") -> None:
         pass
 
 
+# Lazily created dialog class; defining it needs simpledialog, which
+# may be absent, so the class object is built on first use and cached.
+_VALIDATED_DIALOG_CLS = None
+
+
+def _validated_dialog_cls():
+    """Return the validated-prompt dialog class, creating it lazily."""
+    global _VALIDATED_DIALOG_CLS
+    if _VALIDATED_DIALOG_CLS is not None:
+        return _VALIDATED_DIALOG_CLS
+
+    class _ValidatedDialog(simpledialog.Dialog):
+        """Modal string prompt that validates inline.
+
+        Invalid input highlights the entry and shows an error label in
+        the same dialog instead of tearing it down and popping a
+        second modal ``showerror`` per attempt.  ``validator`` maps
+        the raw string to the accepted value, or ``None`` to reject.
+        ``result`` is ``None`` when the user cancels.
+        """
+
+        def __init__(self, parent, title, prompt, validator, error_text):
+            self._prompt = prompt
+            self._validator = validator
+            self._error_text = error_text
+            self._value = None
+            super().__init__(parent, title)
+
+        def body(self, master):
+            tk.Label(master, text=self._prompt, justify='left').grid(
+                row=0, sticky='w'
+            )
+            self._entry = tk.Entry(master, width=24)
+            self._entry.grid(row=1, sticky='we', pady=4)
+            self._error = tk.Label(master, text='', fg='red')
+            self._error.grid(row=2, sticky='w')
+            return self._entry
+
+        def validate(self):
+            value = self._validator(self._entry.get())
+            if value is None:
+                self._error.config(text=self._error_text)
+                self._entry.config(fg='red')
+                return 0
+            self._value = value
+            return 1
+
+        def apply(self):
+            self.result = self._value
+
+    _VALIDATED_DIALOG_CLS = _ValidatedDialog
+    return _VALIDATED_DIALOG_CLS
+
+
+# Lazily created two-field setup dialog class; cached for the same
+# reason as the validated prompt above.
+_SETUP_DIALOG_CLS = None
+
+
+def _setup_dialog_cls():
+    """Return the combined period/lunch dialog class, creating it lazily."""
+    global _SETUP_DIALOG_CLS
+    if _SETUP_DIALOG_CLS is not None:
+        return _SETUP_DIALOG_CLS
+
+    class _SetupDialog(simpledialog.Dialog):
+        """First-run form asking for period and lunch in one dialog.
+
+        Both values are validated on OK with inline error feedback;
+        ``result`` is a ``(period, lunch_option)`` tuple, or ``None``
+        when the user cancels.  Known values are prefilled so the
+        student only types what is missing.
+        """
+
+        def __init__(self, parent, initial_period=None, initial_lunch=None):
+            self._initial_period = initial_period
+            self._initial_lunch = initial_lunch
+            super().__init__(parent, "Skaphysics Setup")
+
+        def body(self, master):
+            tk.Label(master, text="Enter your physics period number (1‑7):", justify='left').grid(
+                row=0, sticky='w'
+            )
+            self._period_entry = tk.Entry(master, width=24)
+            self._period_entry.grid(row=1, sticky='we', pady=(0, 8))
+            if self._initial_period is not None:
+                self._period_entry.insert(0, str(self._initial_period))
+            tk.Label(
+                master,
+                text="Select your lunch pattern:\n1 – first lunch (class 12:05–13:05)\n2 – second lunch (class 11:25–12:25)",
+                justify='left',
+            ).grid(row=2, sticky='w')
+            self._lunch_entry = tk.Entry(master, width=24)
+            self._lunch_entry.grid(row=3, sticky='we', pady=(0, 4))
+            if self._initial_lunch is not None:
+                self._lunch_entry.insert(0, self._initial_lunch)
+            self._error = tk.Label(master, text='', fg='red')
+            self._error.grid(row=4, sticky='w')
+            if self._initial_period is None:
+                return self._period_entry
+            return self._lunch_entry
+
+        def validate(self):
+            try:
+                period = int(self._period_entry.get().strip())
+            except ValueError:
+                period = None
+            if period is None or not 1 <= period <= 7:
+                self._error.config(text="Please enter a period between 1 and 7.")
+                self._period_entry.config(fg='red')
+                return 0
+            self._period_entry.config(fg='black')
+            lunch = self._lunch_entry.get().strip()
+            if lunch not in {"1", "2"}:
+                self._error.config(text="Please enter 1 or 2 for lunch.")
+                self._lunch_entry.config(fg='red')
+                return 0
+            self._values = (period, lunch)
+            return 1
+
+        def apply(self):
+            self.result = self._values
+
+    _SETUP_DIALOG_CLS = _SetupDialog
+    return _SETUP_DIALOG_CLS
+
+
+def ask_setup(
+    initial_period: Optional[int] = None,
+    initial_lunch: Optional[str] = None,
+) -> Tuple[int, str]:
+    """Prompt for the period and lunch option in a single dialog.
+
+    Cancelling behaves like the individual prompts did: with no period
+    known the application exits; otherwise the known period is kept and
+    the lunch option falls back to the module default.
+    """
+    if tk is None or simpledialog is None:
+        if initial_period is None:
+            raise RuntimeError("Tkinter is required to prompt for the period")
+        return initial_period, initial_lunch or LUNCH_OPTION
+    dialog = _setup_dialog_cls()(_get_tk_root(), initial_period, initial_lunch)
+    if dialog.result is None:
+        if initial_period is None:
+            # user cancelled; exit gracefully
+            sys.exit(0)
+        return initial_period, initial_lunch or LUNCH_OPTION
+    return dialog.result
+
+
 def ask_period() -> int:
     """Prompt the user for their physics period using a simple dialog."""
     if tk is None or simpledialog is None:
         raise RuntimeError("Tkinter is required to prompt for the period")
-    root = tk.Tk()
-    root.withdraw()
-    while True:
-        result = simpledialog.askstring(
-            "Class Period",
-            "Enter your physics period number (1‑7):",
-            parent=root,
-        )
-        if result is None:
-            # user cancelled; exit gracefully
-            sys.exit(0)
+
+    def _valid_period(raw: str) -> Optional[int]:
         try:
-            value = int(result)
-            if 1 <= value <= 7:
-                root.destroy()
-                return value
+            value = int(raw.strip())
         except ValueError:
-            pass
-        messagebox.showerror("Invalid input", "Please enter a number between 1 and 7.")
+            return None
+        return value if 1 <= value <= 7 else None
+
+    dialog = _validated_dialog_cls()(
+        _get_tk_root(),
+        "Class Period",
+        "Enter your physics period number (1‑7):",
+        _valid_period,
+        "Please enter a number between 1 and 7.",
+    )
+    if dialog.result is None:
+        # user cancelled; exit gracefully
+        sys.exit(0)
+    return dialog.result
 
 def ask_lunch() -> str:
     """Prompt the user to select their lunch option (first or second).
@@ -231,24 +557,22 @@ def ask_lunch() -> str:
     if tk is None or simpledialog is None:
         # If we cannot prompt graphically, fall back to the global default
         return LUNCH_OPTION
-    root = tk.Tk()
-    root.withdraw()
-    while True:
-        result = simpledialog.askstring(
-            "Lunch Option",
-            "Select your lunch pattern:\n1 – first lunch (class 12:05–13:05)\n2 – second lunch (class 11:25–12:25)",
-            parent=root,
-        )
-        if result is None:
-            # user cancelled; use default and exit
-            root.destroy()
-            return LUNCH_OPTION
-        cleaned = result.strip()
-        if cleaned in {"1", "2"}:
-            root.destroy()
-            return cleaned
-        # invalid input – show an error and continue loop
-        messagebox.showerror("Invalid input", "Please enter 1 or 2.")
+
+    def _valid_lunch(raw: str) -> Optional[str]:
+        cleaned = raw.strip()
+        return cleaned if cleaned in {"1", "2"} else None
+
+    dialog = _validated_dialog_cls()(
+        _get_tk_root(),
+        "Lunch Option",
+        "Select your lunch pattern:\n1 – first lunch (class 12:05–13:05)\n2 – second lunch (class 11:25–12:25)",
+        _valid_lunch,
+        "Please enter 1 or 2.",
+    )
+    if dialog.result is None:
+        # user cancelled; use default and exit
+        return LUNCH_OPTION
+    return dialog.result
 
 
 def get_time_slots(is_wednesday: bool, lunch_option: Optional[str] = None) -> List[ClassTime]:
@@ -283,28 +607,39 @@ def get_time_slots(is_wednesday: bool, lunch_option: Optional[str] = None) -> Li
         start and end times of the day's blocks.
     """
     selected = lunch_option or LUNCH_OPTION
-    if selected == "1":
+    return list(_build_time_slots(is_wednesday, selected))
+
+
+@lru_cache(maxsize=4)
+def _build_time_slots(is_wednesday: bool, lunch_option: str) -> Tuple[ClassTime, ...]:
+    """Construct the five time slots for one of the four day variants.
+
+    Only four (is_wednesday, lunch_option) combinations exist, so every
+    call after the first per variant reuses the cached tuple instead of
+    building ten fresh ``dttime``/``ClassTime`` objects.
+    """
+    if lunch_option == "1":
         midday_start = dttime(12, 5)
         midday_end = dttime(13, 5)
     else:
         midday_start = dttime(11, 25)
         midday_end = dttime(12, 25)
     if not is_wednesday:
-        return [
+        return (
             ClassTime(dttime(8, 30), dttime(9, 30)),
             ClassTime(dttime(9, 35), dttime(10, 35)),
             ClassTime(midday_start, midday_end),
             ClassTime(dttime(13, 10), dttime(14, 10)),
             ClassTime(dttime(14, 15), dttime(15, 15)),
-        ]
+        )
     else:
-        return [
+        return (
             ClassTime(dttime(9, 15), dttime(10, 15)),
             ClassTime(dttime(10, 20), dttime(11, 20)),
             ClassTime(midday_start, midday_end),
             ClassTime(dttime(13, 10), dttime(14, 10)),
             ClassTime(dttime(14, 15), dttime(15, 15)),
-        ]
+        )
 
 # -----------------------------------------------------------------------------
 # Letter day rotation
@@ -341,6 +676,24 @@ FIRST_DAY: date = date(2025, 8, 14)
 # "2" (second lunch) for backward compatibility.
 LUNCH_OPTION: str = "2"
 
+# URL of the Schoology calendar.  The middle school application opens
+# this page after creating an Outlook appointment so students record
+# assignment details in Schoology rather than in the appointment body.
+SCHOOLOGY_CALENDAR_URL = "https://app.schoology.com/calendar"
+
+
+def int_to_ordinal(n: int) -> str:
+    """Return the English ordinal string for ``n`` (1 -> "1st").
+
+    Used when titling appointments such as "3rd Period HW due".
+    """
+    if 10 <= n % 100 <= 20:
+        suffix = "th"
+    else:
+        suffix = {1: "st", 2: "nd", 3: "rd"}.get(n % 10, "th")
+    return f"{n}{suffix}"
+
+
 def set_lunch_option(option: str) -> None:
     """Update the global lunch option used by schedule calculations.
 
@@ -354,25 +707,91 @@ def set_lunch_option(option: str) -> None:
     if option in {"1", "2"}:
         LUNCH_OPTION = option
 
-def get_letter_day(current_date: date) -> str:
-    """Return the letter day (A–G) corresponding to ``current_date``.
+# Number of weekdays among the first ``rem`` days following FIRST_DAY
+# (rem = 0..6), precomputed so get_letter_day needs no loop at all.
+_PARTIAL_WEEKDAYS: Tuple[int, ...] = tuple(
+    sum(1 for j in range(1, rem + 1) if (FIRST_DAY.weekday() + j) % 7 < 5)
+    for rem in range(7)
+)
+
+
+@lru_cache(maxsize=512)
+def get_letter_day_index(current_date: date) -> int:
+    """Return the letter-day index (0=A … 6=G) for ``current_date``.
 
     The rotation begins on ``FIRST_DAY`` which is defined as an A day.
     Only weekdays (Monday–Friday) advance the rotation; weekends do not.
     If ``current_date`` is before the rotation start, the function
-    returns "A" to provide a safe default.
+    returns 0 (an A day) to provide a safe default.
+
+    The weekday count is computed arithmetically — five per full week
+    plus a table lookup for the partial week — so the cost stays
+    constant instead of growing with the distance from ``FIRST_DAY``.
+    Internal lookups work with this integer index; ``get_letter_day``
+    wraps it for callers that want the letter itself.
     """
     if current_date <= FIRST_DAY:
-        return LETTERS[0]
-    # count weekdays between FIRST_DAY and current_date
-    weekday_count = 0
-    day = FIRST_DAY
-    while day < current_date:
-        day += timedelta(days=1)
-        if day.weekday() < 5:
-            weekday_count += 1
-    index = weekday_count % len(LETTERS)
-    return LETTERS[index]
+        return 0
+    full_weeks, rem = divmod((current_date - FIRST_DAY).days, 7)
+    weekday_count = full_weeks * 5 + _PARTIAL_WEEKDAYS[rem]
+    return weekday_count % len(LETTERS)
+
+
+def get_letter_day(current_date: date) -> str:
+    """Return the letter day (A–G) corresponding to ``current_date``."""
+    return LETTERS[get_letter_day_index(current_date)]
+
+
+# Flat, index-addressed view of the rotation: the period order per
+# letter index, so hot paths do an array index instead of a string
+# hash.
+PERIOD_ORDER_ARR: Tuple[Tuple[int, ...], ...] = tuple(
+    tuple(PERIOD_ORDER[letter]) for letter in LETTERS
+)
+
+# Lunch options mapped to their position in the schedule table below.
+_LUNCH_IDX: Dict[str, int] = {"1": 0, "2": 1}
+
+def _build_schedule_table() -> Tuple[Tuple[Tuple[Dict[int, Tuple[ClassTime, dttime]], ...], ...], ...]:
+    """Expand the rotation into nested tuples indexed by integers.
+
+    The mapping from a day to its per-period times is fixed for the
+    year, so it is materialised once at import as
+    ``SCHEDULE[weekday][letter_idx][lunch_idx]``, each leaf mapping the
+    period number to its ``ClassTime`` and the precomputed five-minute
+    reminder time.  The reminder loop replaces the
+    letter/order/slot-index dance and the per-check datetime
+    arithmetic with three array indexes and a dict get.
+    """
+    return tuple(
+        tuple(
+            tuple(
+                {
+                    period: (slot, slot.reminder_time(5))
+                    for period, slot in zip(
+                        PERIOD_ORDER_ARR[letter_idx],
+                        _build_time_slots(weekday == 2, lunch),
+                    )
+                }
+                for lunch in ("1", "2")
+            )
+            for letter_idx in range(len(LETTERS))
+        )
+        for weekday in range(5)
+    )
+
+
+SCHEDULE: Tuple[Tuple[Tuple[Dict[int, Tuple[ClassTime, dttime]], ...], ...], ...] = _build_schedule_table()
+
+# Which letter-day indexes each period meets on (five of the seven),
+# used to bound the next-class search to at most one rotation cycle.
+PERIOD_TO_LETTER_IDXS: Dict[int, frozenset] = {
+    period: frozenset(
+        idx for idx, order in enumerate(PERIOD_ORDER_ARR) if period in order
+    )
+    for period in range(1, 8)
+}
+
 
 def get_next_class(period: int, from_date: date, lunch_option: Optional[str] = None) -> Optional[Tuple[date, ClassTime]]:
     """
@@ -393,19 +812,22 @@ def get_next_class(period: int, from_date: date, lunch_option: Optional[str] = N
         Overrides the module‑level ``LUNCH_OPTION`` for calculating
         midday times.  See ``get_time_slots`` for details.
     """
+    letter_idxs = PERIOD_TO_LETTER_IDXS.get(period)
+    if not letter_idxs:
+        return None
+    lunch_idx = _LUNCH_IDX.get(lunch_option or LUNCH_OPTION, 1)
     next_date = from_date + timedelta(days=1)
-    while True:
+    # Every period meets five of seven letter days, so a match is
+    # guaranteed within one rotation cycle; two calendar weeks of
+    # candidates bound the scan regardless of the starting date.
+    for _ in range(14):
         # Skip weekends (Saturday=5, Sunday=6)
-        if next_date.weekday() >= 5:
-            next_date += timedelta(days=1)
-            continue
-        letter = get_letter_day(next_date)
-        order = PERIOD_ORDER.get(letter, [])
-        if period in order:
-            idx = order.index(period)
-            slots = get_time_slots(next_date.weekday() == 2, lunch_option)
-            if idx < len(slots):
-                return next_date, slots[idx]
+        if next_date.weekday() < 5:
+            letter_idx = get_letter_day_index(next_date)
+            if letter_idx in letter_idxs:
+                entry = SCHEDULE[next_date.weekday()][letter_idx][lunch_idx].get(period)
+                if entry is not None:
+                    return next_date, entry[0]
         next_date += timedelta(days=1)
     return None
 
@@ -422,9 +844,8 @@ class ReminderApp:
         period: int
             The student's physics period to monitor.
         check_interval: int, optional
-            Interval in seconds between checks of the current time.  A
-            lower value results in more timely reminders but uses more
-            CPU.
+            Unused since the loop sleeps until the next scheduled
+            reminder; retained only for call-site compatibility.
         lunch_option: Optional[str], optional
             The lunch option to use when calculating class times.  If
             ``None``, the module‑level ``LUNCH_OPTION`` is used.  See
@@ -434,8 +855,31 @@ class ReminderApp:
         self.check_interval = check_interval
         # use provided lunch_option or fall back to global setting
         self.lunch_option = lunch_option or LUNCH_OPTION
-        self.running = True
+        # Shutdown is signalled through an event so the scheduled waits
+        # below can be interrupted immediately.
+        self._stop = threading.Event()
         self.thread: Optional[threading.Thread] = None
+        # Cached Outlook.Application handle; Dispatch is expensive, so
+        # it is created once on first use and dropped on COM errors.
+        # The lock covers the dialog thread and the worker fallback.
+        self._outlook = None
+        self._outlook_lock = threading.Lock()
+        self._com_initialized = False
+
+    @property
+    def running(self) -> bool:
+        return not self._stop.is_set()
+
+    @running.setter
+    def running(self, value: bool) -> None:
+        if value:
+            self._stop.clear()
+        else:
+            self._stop.set()
+
+    def stop(self) -> None:
+        """Signal the monitoring thread to exit and wake any waits."""
+        self._stop.set()
 
     def start(self) -> None:
         """Start the background monitoring thread.
@@ -450,54 +894,101 @@ class ReminderApp:
             self.thread = threading.Thread(target=self._run_loop, daemon=True)
             self.thread.start()
 
+    def _next_reminder(self, now: datetime) -> Optional[Tuple[datetime, ClassTime]]:
+        """Return the next reminder instant for the period, or ``None``.
+
+        Today's slot is considered first (one ``SCHEDULE`` lookup); if
+        the reminder time has already passed, the search falls through
+        to ``get_next_class`` for the next occurrence in the rotation.
+        """
+        today = now.date()
+        if today.weekday() < 5:
+            letter_idx = get_letter_day_index(today)
+            lunch_idx = _LUNCH_IDX.get(self.lunch_option, 1)
+            entry = SCHEDULE[today.weekday()][letter_idx][lunch_idx].get(self.period)
+            if entry is not None:
+                class_time, reminder_time = entry
+                reminder_dt = datetime.combine(today, reminder_time)
+                if reminder_dt > now:
+                    return reminder_dt, class_time
+        next_info = get_next_class(self.period, today, self.lunch_option)
+        if next_info is None:
+            return None
+        next_date, next_time = next_info
+        return datetime.combine(next_date, next_time.reminder_time(5)), next_time
+
+    # Longest single wait in the reminder loop.  Weekend and overnight
+    # gaps are slept through in chunks of this size so suspend/resume
+    # and clock or DST changes are re-evaluated a few times a day.
+    _MAX_IDLE_WAIT = 6 * 3600
+
     def _run_loop(self) -> None:
-        """Main loop that checks the time and triggers reminders."""
+        """Main loop that sleeps until the next reminder and fires it.
+
+        Instead of waking every ``check_interval`` seconds to compare
+        clock fields, the loop computes the next reminder datetime and
+        waits for it in one go — weekends and the hours outside school
+        cost a handful of wakeups rather than one every half minute.
+        Waits are capped at ``_MAX_IDLE_WAIT`` and go through the stop
+        event so shutdown is immediate.
+        """
         while self.running:
             now = datetime.now()
-            # Only consider weekdays (0=Mon, 4=Fri)
-            if now.weekday() < 5:
-                # Determine the current letter day and the order of periods
-                letter = get_letter_day(now.date())
-                order = PERIOD_ORDER.get(letter, [])
-                # If the student's selected period meets today, find its time slot
-                if self.period in order:
-                    slot_index = order.index(self.period)
-                    time_slots = get_time_slots(now.weekday() == 2, self.lunch_option)
-                    if slot_index < len(time_slots):
-                        class_time = time_slots[slot_index]
-                        reminder_time = class_time.reminder_time(5)
-                        # Check if the current time matches the reminder time
-                        if (
-                            now.time().hour == reminder_time.hour
-                            and now.time().minute == reminder_time.minute
-                        ):
-                            self.show_reminder(now.date(), class_time)
-                            # Avoid duplicate prompts within the same minute
-                            time.sleep(60)
-                            continue
-            time.sleep(self.check_interval)
+            target = self._next_reminder(now)
+            if target is None:
+                # No upcoming class found; re-check after the cap.
+                if self._stop.wait(self._MAX_IDLE_WAIT):
+                    break
+                continue
+            reminder_dt, class_time = target
+            wait = (reminder_dt - now).total_seconds()
+            if wait > self._MAX_IDLE_WAIT:
+                if self._stop.wait(self._MAX_IDLE_WAIT):
+                    break
+                continue
+            if wait > 0 and self._stop.wait(wait):
+                break
+            # Guard against wall-clock jumps: only fire once the
+            # reminder time has genuinely been reached.
+            if datetime.now() < reminder_dt:
+                continue
+            self.show_reminder(reminder_dt.date(), class_time)
 
     def show_reminder(self, class_date: date, class_time: ClassTime) -> None:
         """
         Display the reminder window.
 
+        When the main thread is running the Tk event loop, the dialog
+        is scheduled onto it with ``after`` so the reminder thread
+        never touches Tk directly; otherwise (headless or imported
+        use) it is shown inline as before.
+        """
+        if tk is None:
+            return
+        if _TK_MAINLOOP_RUNNING and _TK_ROOT is not None:
+            try:
+                _TK_ROOT.after(
+                    0, lambda: self._show_reminder_dialog(class_date, class_time)
+                )
+                return
+            except Exception:
+                pass
+        self._show_reminder_dialog(class_date, class_time)
+
+    def _show_reminder_dialog(self, class_date: date, class_time: ClassTime) -> None:
+        """Show the yes/no prompt and create the follow-up appointment.
+
         When the user clicks “Yes” the application searches for the next
         occurrence of the selected period using the letter rotation and
         creates an Outlook appointment for that class.  The student can
         then enter the assignment details.  If the user clicks “No” the
         reminder simply closes.
         """
-        if tk is None:
-            return
-        root = tk.Tk()
-        root.withdraw()
-        root.attributes('-topmost', True)
         result = messagebox.askyesno(
             title="Homework Reminder",
             message="Do you have homework for tonight?",
-            parent=root,
+            parent=_get_tk_root(),
         )
-        root.destroy()
         if result:
             # Find the next date/time when this period meets
             next_info = get_next_class(self.period, class_date, self.lunch_option)
@@ -516,16 +1007,25 @@ class ReminderApp:
         that the reminder application continues to run without
         interruption.
         """
-        if win32com is None or pythoncom is None:
+        win32com_client, pythoncom, pywintypes = _import_outlook()
+        if win32com_client is None or pythoncom is None:
             return
         try:
-            # Each thread that uses COM must initialize it.  Without
-            # calling CoInitialize the Dispatch call may silently fail.
-            pythoncom.CoInitialize()
-            outlook = win32com.Dispatch('Outlook.Application')
+            with self._outlook_lock:
+                if self._outlook is None:
+                    # Each thread that uses COM must initialize it.
+                    # Without calling CoInitialize the Dispatch call
+                    # may silently fail.
+                    if not self._com_initialized:
+                        pythoncom.CoInitialize()
+                        self._com_initialized = True
+                    self._outlook = win32com_client.Dispatch('Outlook.Application')
+                outlook = self._outlook
             appt = outlook.CreateItem(1)  # 1=olAppointmentItem
-            appt.Start = start_dt.strftime("%m/%d/%Y %H:%M")
-            appt.End = end_dt.strftime("%m/%d/%Y %H:%M")
+            # Hand Outlook native COM times rather than strings it
+            # would have to re-parse under the current locale.
+            appt.Start = pywintypes.Time(start_dt)
+            appt.End = pywintypes.Time(end_dt)
             appt.Subject = "Homework"
             appt.Body = "Enter your assignment details here."
             appt.ReminderSet = True
@@ -533,27 +1033,28 @@ class ReminderApp:
             # Display the appointment window so the student can modify it
             appt.Display(True)
         except Exception:
-            pass
+            # Drop the cached handle so a restarted Outlook gets a
+            # fresh Dispatch on the next reminder.
+            with self._outlook_lock:
+                self._outlook = None
 
 
 def main() -> None:
     # Determine the directory of the running script
     config_dir = Path(os.environ.get('APPDATA', Path.home())) / 'SkaphysicsHomeworkReminder'
-config_dir.mkdir(parents=True, exist_ok=True)
-config_path = config_dir / 'student_config.json'
+    config_dir.mkdir(parents=True, exist_ok=True)
+    config_path = config_dir / 'student_config.json'
     config: Dict[str, Any] = load_config(config_path)
     # Retrieve existing configuration values
     period: Optional[int] = config.get("period")
     lunch_option: Optional[str] = config.get("lunch_option")  # may be None
-    # Prompt for period if not already stored
-    if period is None:
-        period = ask_period()
+    # Prompt once for anything missing; the combined dialog prefills
+    # known values, so config-cached runs skip the prompt entirely.
+    if period is None or lunch_option not in {"1", "2"}:
+        period, lunch_option = ask_setup(
+            period, lunch_option if lunch_option in {"1", "2"} else None
+        )
         config["period"] = period
-    # Prompt for lunch option if not already stored
-    # Default to first lunch ("1") for physics by design
-    if lunch_option not in {"1", "2"}:
-        # Suggest first lunch as default but allow user choice
-        lunch_option = ask_lunch()
         config["lunch_option"] = lunch_option
     # Persist updated configuration
     save_config(config_path, config)
@@ -569,12 +1070,41 @@ config_path = config_dir / 'student_config.json'
     app.start()
     # Create a tray icon with a quit option so the user can close the app
     setup_tray_icon(app)
-    # Keep the main thread alive until the reminder is stopped
-    try:
-        while app.running:
-            time.sleep(1)
-    except KeyboardInterrupt:
-        app.running = False
+    # Keep the main thread alive until the reminder is stopped.  When
+    # Tk is available the main thread runs its event loop so reminder
+    # dialogs can be dispatched onto it; otherwise fall back to waiting
+    # on the running flag.
+    global _TK_MAINLOOP_RUNNING
+    root = None
+    if tk is not None:
+        try:
+            root = _get_tk_root()
+        except Exception:
+            root = None
+    if root is not None:
+        def _quit_when_stopped() -> None:
+            # Wake the event loop once the tray (or anything else)
+            # stops the app.
+            app._stop.wait()
+            try:
+                root.after(0, root.quit)
+            except Exception:
+                pass
+        threading.Thread(target=_quit_when_stopped, daemon=True).start()
+        _TK_MAINLOOP_RUNNING = True
+        try:
+            root.mainloop()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            _TK_MAINLOOP_RUNNING = False
+            app.running = False
+    else:
+        try:
+            while app.running:
+                time.sleep(1)
+        except KeyboardInterrupt:
+            app.running = False
 
 
 if __name__ == "__main__":